@@ -1,10 +1,6 @@
-"""
-Agent package for AI Mental Health Support System
-Contains all specialized agent nodes and routing logic
-"""
-
 """
 Agent Package - Modular mental health support agents
+Contains all specialized agent nodes and routing logic
 """
 
 from .router_agent import router_node
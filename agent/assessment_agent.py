@@ -4,6 +4,32 @@ Assessment Agent - Mental health screening and DASS-21 guidance
 
 from typing import TypedDict, List
 from langchain_groq import ChatGroq
+import re
+import sys
+import logging
+from bisect import bisect_right
+from functools import lru_cache
+from string import Formatter
+from .keyword_matcher import KeywordMatcher
+from .cache import normalize_query, generate_query_seed, get_cached_response, cache_response
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# KEYWORD CLASSIFIER - Built once at import, single scan per query
+# ============================================================================
+
+ASSESSMENT_KEYWORDS = KeywordMatcher({
+    'dass21': ['dass-21', 'dass 21', 'dass21', 'what is dass', 'tell me about dass', 'explain dass'],
+    'general': ['assessment', 'screening', 'self-assessment', 'mental health test', 'evaluation'],
+    'score': ['score', 'result'],
+    'score_context': ['score', 'result', 'depression'],
+})
+
+# Pattern: "my scores are X, Y, Z" or "depression X anxiety Y stress Z"
+_SCORE_RE = re.compile(r'(\d+)\D+(\d+)\D+(\d+)')
 
 
 # ============================================================================
@@ -80,84 +106,108 @@ DASS21_SCORE_TEMPLATE = """**Your DASS-21 Results:** 📊
 Remember, I'm here as your supportive friend, but a mental health professional can give you personalized care and guidance. You're worth that investment! 💙😊"""
 
 
+# Template parsed once into (literal, field) pieces - rendering skips the
+# format-string tokenizer (template uses plain {field} placeholders only)
+_PARSED_SCORE_TEMPLATE = tuple(
+    (literal, field) for literal, field, _, _ in Formatter().parse(DASS21_SCORE_TEMPLATE)
+)
+
+
+def _render_score_template(**fields) -> str:
+    """Render DASS21_SCORE_TEMPLATE from its pre-parsed pieces."""
+    parts = []
+    for literal, field in _PARSED_SCORE_TEMPLATE:
+        parts.append(literal)
+        if field is not None:
+            parts.append(str(fields[field]))
+    return ''.join(parts)
+
+
+# ============================================================================
+# SEVERITY TABLE - DASS-21 cutoffs, one binary search per score
+# ============================================================================
+
+# Interned so callers comparing against a label ('Extremely Severe' has a space,
+# so CPython does not intern it automatically) hit the identity fast path
+SEVERITY_LABELS = tuple(map(sys.intern, ('Normal', 'Mild', 'Moderate', 'Severe', 'Extremely Severe')))
+
+# Lowest score of each level above Normal (Mild, Moderate, Severe, Extremely Severe)
+SEVERITY_CUTOFFS = {
+    'depression': (10, 14, 21, 28),
+    'anxiety': (8, 10, 15, 20),
+    'stress': (15, 19, 26, 34),
+}
+
+
 def get_severity_level(score: int, assessment_type: str) -> str:
     """
     Calculate severity level from DASS-21 score.
     Returns: 'Normal', 'Mild', 'Moderate', 'Severe', or 'Extremely Severe'
     """
-    if assessment_type.lower() == 'depression':
-        if score <= 9: return 'Normal'
-        elif score <= 13: return 'Mild'
-        elif score <= 20: return 'Moderate'
-        elif score <= 27: return 'Severe'
-        else: return 'Extremely Severe'
-    
-    elif assessment_type.lower() == 'anxiety':
-        if score <= 7: return 'Normal'
-        elif score <= 9: return 'Mild'
-        elif score <= 14: return 'Moderate'
-        elif score <= 19: return 'Severe'
-        else: return 'Extremely Severe'
-    
-    elif assessment_type.lower() == 'stress':
-        if score <= 14: return 'Normal'
-        elif score <= 18: return 'Mild'
-        elif score <= 25: return 'Moderate'
-        elif score <= 33: return 'Severe'
-        else: return 'Extremely Severe'
-    
-    return 'Unknown'
+    cutoffs = SEVERITY_CUTOFFS.get(assessment_type.lower())
+    if cutoffs is None:
+        return 'Unknown'
+    return SEVERITY_LABELS[bisect_right(cutoffs, score)]
 
 
-def format_dass21_results(depression: int, anxiety: int, stress: int) -> str:
-    """
-    Format DASS-21 results using static template (NO LLM).
-    Returns fully formatted results string.
-    """
-    # Get severity levels
-    dep_severity = get_severity_level(depression, 'depression')
-    anx_severity = get_severity_level(anxiety, 'anxiety')
-    stress_severity = get_severity_level(stress, 'stress')
-    
-    # Determine interpretation based on highest severity
-    severities = [dep_severity, anx_severity, stress_severity]
-    severity_order = ['Normal', 'Mild', 'Moderate', 'Severe', 'Extremely Severe']
-    max_severity = max(severities, key=lambda x: severity_order.index(x) if x in severity_order else 0)
-    
-    # Generate interpretation
-    if max_severity == 'Normal':
-        interpretation = """Your scores are in the normal range! 😊 This suggests you're managing well overall. Keep up with self-care and healthy coping strategies."""
-        recommendations = """• Continue your current self-care practices
+# Severe and Extremely Severe share the same guidance
+_SEVERE_INTERPRETATION = (
+    """Your scores indicate significant distress. Professional support is strongly recommended to help you through this difficult time.""",
+    """• Please reach out to a mental health professional soon
+• IMH 24/7 Helpline: 6389-2222 for immediate support
+• CHAT (16-30): 6493-6500 for free counseling
+• Your wellbeing matters - don't wait to seek help"""
+)
+
+# (interpretation, recommendations) shown for the highest severity across scales,
+# indexed by severity rank (see SEVERITY_LABELS)
+SEVERITY_INTERPRETATIONS = (
+    (  # Normal
+        """Your scores are in the normal range! 😊 This suggests you're managing well overall. Keep up with self-care and healthy coping strategies.""",
+        """• Continue your current self-care practices
 • Stay connected with supportive people
 • Reach out if things change"""
-    
-    elif max_severity == 'Mild':
-        interpretation = """Your scores show mild symptoms in some areas. This is common and manageable with the right support and coping strategies."""
-        recommendations = """• Try stress-reduction techniques (breathing exercises, mindfulness)
+    ),
+    (  # Mild
+        """Your scores show mild symptoms in some areas. This is common and manageable with the right support and coping strategies.""",
+        """• Try stress-reduction techniques (breathing exercises, mindfulness)
 • Talk to trusted friends or family
 • Consider speaking with a counselor if symptoms persist"""
-    
-    elif max_severity == 'Moderate':
-        interpretation = """Your scores indicate moderate symptoms. This suggests you could benefit from professional support to develop coping strategies."""
-        recommendations = """• Consider talking to a mental health professional
+    ),
+    (  # Moderate
+        """Your scores indicate moderate symptoms. This suggests you could benefit from professional support to develop coping strategies.""",
+        """• Consider talking to a mental health professional
 • CHAT services (for 16-30): Free counseling at 6493-6500
 • Your GP can provide referrals to counseling services"""
+    ),
+    _SEVERE_INTERPRETATION,  # Severe
+    _SEVERE_INTERPRETATION,  # Extremely Severe
+)
+
+
+@lru_cache(maxsize=4096)
+def format_dass21_results(depression: int, anxiety: int, stress: int) -> str:
+    """
+    Format DASS-21 results using static template (NO LLM).
+    Returns fully formatted results string.
+    Cached: output depends only on the three scores (0-42 each).
+    """
+    # Get severity ranks (0 = Normal ... 4 = Extremely Severe)
+    dep_rank = bisect_right(SEVERITY_CUTOFFS['depression'], depression)
+    anx_rank = bisect_right(SEVERITY_CUTOFFS['anxiety'], anxiety)
+    stress_rank = bisect_right(SEVERITY_CUTOFFS['stress'], stress)
     
-    else:  # Severe or Extremely Severe
-        interpretation = """Your scores indicate significant distress. Professional support is strongly recommended to help you through this difficult time."""
-        recommendations = """• Please reach out to a mental health professional soon
-• IMH 24/7 Helpline: 6389-2222 for immediate support
-• CHAT (16-30): 6493-6500 for free counseling
-• Your wellbeing matters - don't wait to seek help"""
+    # Interpretation is indexed directly by the highest rank
+    interpretation, recommendations = SEVERITY_INTERPRETATIONS[max(dep_rank, anx_rank, stress_rank)]
     
     # Fill in template
-    return DASS21_SCORE_TEMPLATE.format(
+    return _render_score_template(
         depression_score=depression,
-        depression_severity=dep_severity,
+        depression_severity=SEVERITY_LABELS[dep_rank],
         anxiety_score=anxiety,
-        anxiety_severity=anx_severity,
+        anxiety_severity=SEVERITY_LABELS[anx_rank],
         stress_score=stress,
-        stress_severity=stress_severity,
+        stress_severity=SEVERITY_LABELS[stress_rank],
         interpretation=interpretation,
         recommendations=recommendations
     )
@@ -177,19 +227,22 @@ def assessment_agent_node(state: AgentState, llm: ChatGroq, get_relevant_context
     Uses static templates instead of LLM for standard explanations.
     """
     
-    print("\n" + "="*60)
-    print("📊 [AGENT ACTIVATED: Assessment Agent]")
-    print("="*60)
+    logger.debug("📊 [AGENT ACTIVATED: Assessment Agent]")
     
     query = state["current_query"]
-    query_lower = query.lower()
+    # Normalize once; reused for classification, score parsing and the seed
+    query_norm = normalize_query(query)
+    
+    # Classify the query in a single pass over all assessment keywords.
+    # Branch order below is PRIORITY, not frequency: categories overlap
+    # ("dass-21 assessment" is both), and each check is now an O(1) set lookup.
+    matched = ASSESSMENT_KEYWORDS.categories(query_norm)
     
     # ========================================================================
     # OPTIMIZATION 1: Check if asking for DASS-21 explanation (instant answer)
     # ========================================================================
-    dass21_keywords = ['dass-21', 'dass 21', 'dass21', 'what is dass', 'tell me about dass', 'explain dass']
-    if any(keyword in query_lower for keyword in dass21_keywords):
-        print("⚡ DASS-21 EXPLANATION: Returning static template (no LLM)")
+    if 'dass21' in matched:
+        logger.debug("⚡ DASS-21 EXPLANATION: Returning static template (no LLM)")
         state["messages"].append(DASS21_EXPLANATION)
         state["current_agent"] = "complete"
         return state
@@ -197,12 +250,9 @@ def assessment_agent_node(state: AgentState, llm: ChatGroq, get_relevant_context
     # ========================================================================
     # OPTIMIZATION 2: Check if asking for general assessment info (instant answer)
     # ========================================================================
-    general_keywords = ['assessment', 'screening', 'self-assessment', 'mental health test', 'evaluation']
-    specific_keywords = ['dass-21', 'dass 21', 'phq', 'gad']
-    
     # If asking about assessments generally (not specific DASS-21 scores)
-    if any(keyword in query_lower for keyword in general_keywords) and not any('score' in query_lower or 'result' in query_lower):
-        print("⚡ GENERAL ASSESSMENT INFO: Returning static template (no LLM)")
+    if 'general' in matched and 'score' not in matched:
+        logger.debug("⚡ GENERAL ASSESSMENT INFO: Returning static template (no LLM)")
         state["messages"].append(ASSESSMENT_GENERAL_INFO)
         state["current_agent"] = "complete"
         return state
@@ -210,18 +260,16 @@ def assessment_agent_node(state: AgentState, llm: ChatGroq, get_relevant_context
     # ========================================================================
     # OPTIMIZATION 3: Check if providing scores for interpretation (template-based)
     # ========================================================================
-    # Pattern: "my scores are X, Y, Z" or "depression X anxiety Y stress Z"
-    import re
-    score_pattern = r'(\d+).*?(\d+).*?(\d+)'
-    score_match = re.search(score_pattern, query)
+    # Cheap set lookup first: only scan for numbers when the query mentions scores
+    score_match = 'score_context' in matched and _SCORE_RE.search(query_norm)
     
-    if score_match and ('score' in query_lower or 'result' in query_lower or 'depression' in query_lower):
+    if score_match:
         try:
             scores = [int(score_match.group(1)), int(score_match.group(2)), int(score_match.group(3))]
             
             # Validate scores (DASS-21 scores typically 0-42)
-            if all(0 <= score <= 42 for score in scores):
-                print(f"⚡ SCORE INTERPRETATION: Using template with scores {scores} (no LLM)")
+            if 0 <= min(scores) and max(scores) <= 42:
+                logger.debug("⚡ SCORE INTERPRETATION: Using template with scores %s (no LLM)", scores)
                 
                 # Assume order: depression, anxiety, stress (most common)
                 results = format_dass21_results(scores[0], scores[1], scores[2])
@@ -234,7 +282,15 @@ def assessment_agent_node(state: AgentState, llm: ChatGroq, get_relevant_context
     # ========================================================================
     # FALLBACK: Use LLM only for specific/unusual assessment questions
     # ========================================================================
-    print("💬 SPECIFIC QUERY: Using LLM for nuanced response")
+    logger.debug("💬 SPECIFIC QUERY: Using LLM for nuanced response")
+    
+    # Same question (case/whitespace aside) -> same answer: skip retrieval and the LLM
+    cache_key = ('assessment', query_norm)
+    cached_response = get_cached_response(cache_key)
+    if cached_response is not None:
+        state["messages"].append(cached_response)
+        state["current_agent"] = "complete"
+        return state
     
     # Get DASS-21 and assessment context
     assessment_context = get_relevant_context(f"DASS-21 mental health assessment screening {query}", n_results=3)
@@ -249,20 +305,20 @@ User Query: "{query}"
 Provide warm, supportive guidance about mental health assessments. Keep it brief (2-3 sentences).
 Start with "Hey, I'm Sunny! 😊" and emphasize that self-assessment tools provide insights but professional support is valuable."""
     
+    # Generate deterministic seed for consistent assessment responses
+    query_seed = generate_query_seed(query_norm)
+    
     try:
-        # Generate deterministic seed for consistent assessment responses
-        import hashlib
-        query_seed = int(hashlib.md5(query.lower().strip().encode()).hexdigest()[:8], 16)
-        
         response = llm.invoke(
             assessment_prompt,
             config={"configurable": {"seed": query_seed}}
         ).content
         
         response += "\n\n💙 *Remember, these tools are starting points. A mental health professional can give you the complete picture! 😊*"
+        cache_response(cache_key, response)
         
     except Exception as e:
-        print(f"Assessment agent error: {e}")
+        logger.error("Assessment agent error: %s", e)
         # Fallback to general info
         response = ASSESSMENT_GENERAL_INFO
     
@@ -0,0 +1,99 @@
+"""
+Cache Utilities - Bounded in-process caches for the agent hot paths
+Used to skip repeated ChromaDB retrievals and LLM calls for identical queries
+"""
+
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache with an optional time-to-live.
+
+    Flask serves requests from several threads, so every access is guarded by
+    a lock. Entries older than `ttl` seconds are treated as missing.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        """
+        Args:
+            maxsize: Maximum number of entries before the oldest is evicted
+            ttl: Seconds an entry stays valid (None = no expiry)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing/expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, stored_at = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries (e.g. after a knowledge base update)."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for use as a cache key (case-insensitive, trimmed)."""
+    return query.casefold().strip()
+
+
+def generate_query_seed(query: str) -> int:
+    """
+    Deterministic 32-bit LLM seed for a query (case-insensitive, trimmed).
+
+    The seed only needs to be stable, not cryptographic, so CRC32 replaces the
+    old MD5 hexdigest -> int round-trip. Normalization is idempotent, so callers
+    may pass a query they have already run through normalize_query().
+    """
+    return zlib.crc32(normalize_query(query).encode())
+
+
+# ============================================================================
+# LLM RESPONSE CACHE - Skip the Groq round-trip for repeated seeded prompts
+# ============================================================================
+
+# Disable with LLM_CACHE_ENABLED=false (e.g. when testing response variety)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+
+llm_response_cache = LRUCache(maxsize=2048)
+
+
+def get_cached_response(key: Hashable) -> Optional[str]:
+    """Return a cached LLM response for key, or None on a miss."""
+    if not LLM_CACHE_ENABLED:
+        return None
+    return llm_response_cache.get(key)
+
+
+def cache_response(key: Hashable, response: str) -> None:
+    """Store a successful LLM response under key."""
+    if LLM_CACHE_ENABLED:
+        llm_response_cache.set(key, response)
@@ -4,39 +4,23 @@ Crisis Agent - Immediate intervention for crisis situations
 
 from typing import TypedDict, List
 from langchain_groq import ChatGroq
-from .sunny_persona import get_sunny_persona, build_sunny_prompt, get_boundary_statements
+import re
+import logging
+from .sunny_persona import build_sunny_prompt, get_boundary_statements
+from .cache import normalize_query, generate_query_seed, get_cached_response, cache_response
 
+# Configure logger
+logger = logging.getLogger(__name__)
 
-class AgentState(TypedDict):
-    current_query: str
-    messages: List[str]
-    current_agent: str
-    crisis_detected: bool
-    context: str
 
+# ============================================================================
+# STATIC CRISIS PROMPT PARTS - Only the user query is filled in per call
+# ============================================================================
 
-def crisis_intervention_node(state: AgentState, llm: ChatGroq, get_relevant_context) -> AgentState:
-    """Crisis intervention with Sunny's caring presence and immediate support protocols.
-    
-    OPTIMIZED: No ChromaDB queries - crisis requires INSTANT response.
-    All critical info is hardcoded in the prompt for maximum speed.
-    """
-    
-    # Load Sunny's persona components
-    sunny = get_sunny_persona()
-    boundaries = get_boundary_statements()
-    
-    print("\n" + "="*60)
-    print("🚨 [SUNNY - CRISIS INTERVENTION ACTIVATED]")
-    print("="*60)
-    
-    query = state["current_query"]
-    
-    # OPTIMIZATION: Skip ChromaDB query - crisis needs INSTANT response
-    # Hardcode all critical emergency info directly in the prompt
-    print("⚡ CRISIS MODE: Skipping DB query for instant response")
-    
-    crisis_knowledge = """
+# Sunny's crisis validation line - static persona config, resolved once at import
+_CRISIS_URGENCY = get_boundary_statements()['crisis']['urgency']
+
+_CRISIS_KNOWLEDGE = """
     EMERGENCY CONTACTS (Singapore):
     - SOS Helpline: 1767 (24/7, free, emotional support)
     - IMH Emergency: 6389-2222 (psychiatric emergency)
@@ -51,14 +35,13 @@ def crisis_intervention_node(state: AgentState, llm: ChatGroq, get_relevant_cont
     4. Encourage professional help NOW
     5. Stay calm, caring, and directive
     """
-    
-    crisis_prompt = build_sunny_prompt(
-        agent_type='crisis',
-        context=f"Crisis situation detected.\n\n{crisis_knowledge}\n\nUser: \"{query}\"",
-        specific_instructions=f"""As Sunny, I'm here with you right now in this crisis. Respond with urgent care while maintaining your warm presence.
+
+_CRISIS_CONTEXT_PREFIX = f"Crisis situation detected.\n\n{_CRISIS_KNOWLEDGE}\n\nUser: "
+
+_CRISIS_INSTRUCTIONS = f"""As Sunny, I'm here with you right now in this crisis. Respond with urgent care while maintaining your warm presence.
 
 IMMEDIATELY provide:
-1. Sunny's caring validation: "{boundaries['crisis']['urgency']}"
+1. Sunny's caring validation: "{_CRISIS_URGENCY}"
 2. Emergency contact information (SOS 1767, IMH 6389-2222)  
 3. Clear steps for immediate safety
 4. Encourage professional help with Sunny's caring tone
@@ -67,30 +50,83 @@ Be Sunny - warm but urgent. Show you care while getting them help right now.
 Use phrases like: "I'm here with you right now", "Your safety matters to me"
 
 Your caring crisis response as Sunny:"""
+
+
+# ============================================================================
+# TIER-0 CRISIS RESPONSE - Unambiguous high-urgency phrases skip the LLM
+# ============================================================================
+
+_CRISIS_INSTANT_RE = re.compile(
+    r'\b(kill myself|end my life|end it all|suicide|suicidal|want to die)\b',
+    re.IGNORECASE
+)
+
+CRISIS_STATIC_RESPONSE = """🆘 Hey, I'm Sunny, and I'm here with you right now. You're not alone in this, okay?
+
+I care about you, and I want you to be safe. Please reach out to someone who can help you right now:
+
+• SOS Hotline: 1767 (24/7, free) - They're amazing listeners
+• IMH Emergency: 6389-2222 - Professional crisis support
+• CHAT Youth Support: 6493-6500 - If you're 16-30
+
+Please reach out to one of these services immediately. Your life matters."""
+
+
+class AgentState(TypedDict):
+    current_query: str
+    messages: List[str]
+    current_agent: str
+    crisis_detected: bool
+    context: str
+
+
+def crisis_intervention_node(state: AgentState, llm: ChatGroq, get_relevant_context) -> AgentState:
+    """Crisis intervention with Sunny's caring presence and immediate support protocols.
+    
+    OPTIMIZED: No ChromaDB queries - crisis requires INSTANT response.
+    All critical info is hardcoded in the prompt for maximum speed.
+    """
+    
+    logger.debug("🚨 [SUNNY - CRISIS INTERVENTION ACTIVATED]")
+    
+    query = state["current_query"]
+    
+    # OPTIMIZATION: Router already flagged a crisis and the wording is unambiguous -
+    # answer instantly with emergency contacts, no prompt building or LLM call
+    if state.get("crisis_detected") and _CRISIS_INSTANT_RE.search(query):
+        logger.debug("⚡ CRISIS MODE: High-urgency phrase, returning static response (no LLM)")
+        state["messages"].append(CRISIS_STATIC_RESPONSE)
+        state["current_agent"] = "complete"
+        return state
+    
+    # OPTIMIZATION: Skip ChromaDB query - crisis needs INSTANT response
+    # Hardcode all critical emergency info directly in the prompt
+    logger.debug("⚡ CRISIS MODE: Skipping DB query for instant response")
+    
+    crisis_prompt = build_sunny_prompt(
+        agent_type='crisis',
+        context=f"{_CRISIS_CONTEXT_PREFIX}\"{query}\"",
+        specific_instructions=_CRISIS_INSTRUCTIONS
     )
     
+    # Generate deterministic seed for consistent crisis responses
+    query_seed = generate_query_seed(query)
+    # Keyed on the full (normalized) text, not the 32-bit seed - a seed collision
+    # must never hand one user another user's crisis reply
+    cache_key = ('crisis', normalize_query(query))
+    
     try:
-        # Generate deterministic seed for consistent crisis responses
-        import hashlib
-        query_seed = int(hashlib.md5(query.lower().strip().encode()).hexdigest()[:8], 16)
-        
-        response = llm.invoke(
-            crisis_prompt,
-            config={"configurable": {"seed": query_seed}}
-        ).content
+        response = get_cached_response(cache_key)
+        if response is None:
+            response = llm.invoke(
+                crisis_prompt,
+                config={"configurable": {"seed": query_seed}}
+            ).content
+            cache_response(cache_key, response)
     except Exception as e:
+        logger.error("Crisis agent error: %s", e)
         # Fallback crisis response
-        response = """
-        🆘 Hey, I'm Sunny, and I'm here with you right now. You're not alone in this, okay?
-        
-        I care about you, and I want you to be safe. Please reach out to someone who can help you right now:
-        
-        • SOS Hotline: 1767 (24/7, free) - They're amazing listeners
-        • IMH Emergency: 6389-2222 - Professional crisis support
-        • CHAT Youth Support: 6493-6500 - If you're 16-30
-        
-        Please reach out to one of these services immediately. Your life matters.
-        """
+        response = CRISIS_STATIC_RESPONSE
     
     state["messages"].append(response)
     state["current_agent"] = "complete"
@@ -2,9 +2,13 @@
 Human Escalation Agent - Professional referrals and complex case support
 """
 
-from typing import TypedDict, List
+from typing import TypedDict, List, Optional, Callable
 from langchain_groq import ChatGroq
 from .sunny_persona import build_sunny_prompt
+from .keyword_matcher import KeywordMatcher
+from .cache import normalize_query
+from functools import lru_cache
+from types import MappingProxyType
 import logging
 
 # Configure logger
@@ -15,10 +19,59 @@ logger = logging.getLogger(__name__)
 # RULE-BASED REFERRAL LOGIC - No LLM decision-making needed
 # ============================================================================
 
+# Keyword buckets scanned in a single pass; rule priority is applied afterwards
+REFERRAL_KEYWORDS = KeywordMatcher({
+    'high_severity': [
+        'severe', 'crisis', 'emergency', 'urgent', 'serious',
+        'hospitalization', 'hospital', 'psychiatrist', 'psychiatric',
+        'medication', 'diagnosis', 'diagnosed', 'treatment',
+        'can\'t cope', 'cant cope', 'overwhelming', 'too much'
+    ],
+    'youth': [
+        'young', 'youth', 'teen', 'teenager', 'student', 'school', 'university',
+        '16', '17', '18', '19', '20', 'twenties', 'college'
+    ],
+})
+
+
+# Service details returned by the rules (shared between calls - treat as read-only)
+_IMH_HIGH_SEVERITY = {
+    'service': 'IMH',
+    'reason': 'high_severity',
+    'priority': 'high',
+    'number': '6389-2222',
+    'availability': '24/7'
+}
+
+_CHAT_YOUTH = {
+    'service': 'CHAT',
+    'reason': 'youth_focused',
+    'priority': 'medium',
+    'number': '6493-6500',
+    'availability': 'Mon-Fri 1-9 PM, Sat 10 AM-4 PM'
+}
+
+_IMH_HIGH_DISTRESS = {
+    'service': 'IMH',
+    'reason': 'high_distress',
+    'priority': 'high',
+    'number': '6389-2222',
+    'availability': '24/7'
+}
+
+_CHAT_DEFAULT = {
+    'service': 'CHAT',
+    'reason': 'accessible_default',
+    'priority': 'medium',
+    'number': '6493-6500',
+    'availability': 'Mon-Fri 1-9 PM, Sat 10 AM-4 PM'
+}
+
+
 def decide_referral_service(query: str, distress_level: str = 'none') -> dict:
     """
     Rule-based referral decision (NO LLM).
-    Returns: dict with 'service', 'reason', 'priority'
+    Returns: dict with 'service', 'reason', 'priority' (shared - do not mutate)
     
     Rules:
     1. High severity/crisis keywords → IMH (24/7 immediate care)
@@ -26,65 +79,36 @@ def decide_referral_service(query: str, distress_level: str = 'none') -> dict:
     3. Moderate distress → CHAT or IMH based on age
     4. General professional help → CHAT (accessible, free)
     """
-    query_lower = query.lower()
+    return _decide_referral(normalize_query(query), distress_level)
+
+
+@lru_cache(maxsize=2048)
+def _decide_referral(query_norm: str, distress_level: str) -> dict:
+    """Cached rule evaluation on the normalized query (see decide_referral_service)."""
+    matched = REFERRAL_KEYWORDS.categories(query_norm)
     
     # Rule 1: High severity keywords → IMH
-    high_severity_keywords = [
-        'severe', 'crisis', 'emergency', 'urgent', 'serious',
-        'hospitalization', 'hospital', 'psychiatrist', 'psychiatric',
-        'medication', 'diagnosis', 'diagnosed', 'treatment',
-        'can\'t cope', 'cant cope', 'overwhelming', 'too much'
-    ]
-    
-    if any(keyword in query_lower for keyword in high_severity_keywords):
-        return {
-            'service': 'IMH',
-            'reason': 'high_severity',
-            'priority': 'high',
-            'number': '6389-2222',
-            'availability': '24/7'
-        }
+    if 'high_severity' in matched:
+        return _IMH_HIGH_SEVERITY
     
     # Rule 2: Youth indicators → CHAT
-    youth_keywords = [
-        'young', 'youth', 'teen', 'teenager', 'student', 'school', 'university',
-        '16', '17', '18', '19', '20', 'twenties', 'college'
-    ]
-    
-    if any(keyword in query_lower for keyword in youth_keywords):
-        return {
-            'service': 'CHAT',
-            'reason': 'youth_focused',
-            'priority': 'medium',
-            'number': '6493-6500',
-            'availability': 'Mon-Fri 1-9 PM, Sat 10 AM-4 PM'
-        }
+    if 'youth' in matched:
+        return _CHAT_YOUTH
     
     # Rule 3: Moderate distress with high distress_level → IMH
     if distress_level == 'high':
-        return {
-            'service': 'IMH',
-            'reason': 'high_distress',
-            'priority': 'high',
-            'number': '6389-2222',
-            'availability': '24/7'
-        }
+        return _IMH_HIGH_DISTRESS
     
     # Rule 4: Default → CHAT (most accessible, free)
-    return {
-        'service': 'CHAT',
-        'reason': 'accessible_default',
-        'priority': 'medium',
-        'number': '6493-6500',
-        'availability': 'Mon-Fri 1-9 PM, Sat 10 AM-4 PM'
-    }
+    return _CHAT_DEFAULT
 
 
 # ============================================================================
 # PRE-CRAFTED SUNNY TEMPLATES - No LLM generation needed
 # ============================================================================
 
-REFERRAL_TEMPLATES = {
+# Read-only view: the dispatch tables below share these strings by reference
+REFERRAL_TEMPLATES = MappingProxyType({
     'CHAT_general': """Hey, I can really hear that you're going through something, and I'm glad you reached out. 💙
 
 I think talking to a professional could make a real difference for you. Since you're between 16-30, **CHAT** is a wonderful free resource:
@@ -172,6 +196,20 @@ These tools can help you:
 ✓ Give professionals helpful information if you do reach out
 
 Would you like to try one? I'm here to support you through it! 💙"""
+})
+
+
+# (service, reason) emitted by decide_referral_service -> template
+_REFERRAL_DISPATCH = {
+    ('CHAT', 'youth_focused'): REFERRAL_TEMPLATES['CHAT_youth'],
+    ('CHAT', 'accessible_default'): REFERRAL_TEMPLATES['CHAT_general'],
+    ('IMH', 'high_severity'): REFERRAL_TEMPLATES['IMH_high_severity'],
+    ('IMH', 'high_distress'): REFERRAL_TEMPLATES['IMH_high_severity'],
+}
+
+_SERVICE_DEFAULT_TEMPLATES = {
+    'CHAT': REFERRAL_TEMPLATES['CHAT_general'],
+    'IMH': REFERRAL_TEMPLATES['IMH_general'],
 }
 
 
@@ -181,23 +219,11 @@ def get_referral_message(service_info: dict, context: str = '') -> str:
     Fills in appropriate template based on service and context.
     """
     service = service_info['service']
-    reason = service_info['reason']
-    
-    # Select appropriate template
-    if service == 'CHAT':
-        if reason == 'youth_focused':
-            return REFERRAL_TEMPLATES['CHAT_youth']
-        else:
-            return REFERRAL_TEMPLATES['CHAT_general']
-    
-    elif service == 'IMH':
-        if reason == 'high_severity' or reason == 'high_distress':
-            return REFERRAL_TEMPLATES['IMH_high_severity']
-        else:
-            return REFERRAL_TEMPLATES['IMH_general']
-    
-    # Fallback
-    return REFERRAL_TEMPLATES['IMH_general']
+    template = _REFERRAL_DISPATCH.get((service, service_info['reason']))
+    if template is None:
+        # Unknown reason: service default; unknown service: IMH general
+        template = _SERVICE_DEFAULT_TEMPLATES.get(service, REFERRAL_TEMPLATES['IMH_general'])
+    return template
 
 
 class AgentState(TypedDict):
@@ -206,19 +232,23 @@ class AgentState(TypedDict):
     current_agent: str
     crisis_detected: bool
     context: str
+    distress_level: str  # 'high', 'mild', or 'none'
 
 
-def human_escalation_node(state: AgentState, llm: ChatGroq, get_relevant_context) -> AgentState:
+def human_escalation_node(
+    state: AgentState,
+    llm: Optional[ChatGroq] = None,
+    get_relevant_context: Optional[Callable] = None
+) -> AgentState:
     """
     Human escalation with professional referrals - OPTIMIZED.
     Uses rule-based logic and pre-crafted templates instead of LLM.
+    `llm` and `get_relevant_context` are accepted for a uniform node signature
+    but never used, so callers need not pass them (no RAG lookup is made).
     """
     
-    logger.info("="*60)
-    logger.info("🤝 [AGENT ACTIVATED: Human Escalation Agent]") 
-    logger.info("="*60)
+    logger.info("🤝 [AGENT ACTIVATED: Human Escalation Agent]")
     
-    query = state["current_query"]
     external_context = state.get("context", "")
     distress_level = state.get("distress_level", "none")
     
@@ -236,9 +266,13 @@ def human_escalation_node(state: AgentState, llm: ChatGroq, get_relevant_context
     # OPTIMIZATION 2: Use rule-based logic to decide referral service
     # ========================================================================
     logger.info("🔍 RULE-BASED ROUTING: Determining best service...")
-    service_info = decide_referral_service(query, distress_level)
+    # Normalize once and hand it straight to the cached rule evaluation
+    query_norm = normalize_query(state["current_query"])
+    service_info = _decide_referral(query_norm, distress_level)
     
-    logger.info(f"✅ SELECTED: {service_info['service']} (reason: {service_info['reason']}, priority: {service_info['priority']})")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("✅ SELECTED: %s (reason: %s, priority: %s)",
+                    service_info['service'], service_info['reason'], service_info['priority'])
     
     # ========================================================================
     # OPTIMIZATION 3: Use pre-crafted template for referral message
@@ -7,10 +7,14 @@ which was removed in LangChain 1.0+. Currently not used by the application.
 The application uses custom ConversationBufferMemory implementation in app.py instead.
 """
 
-from typing import Dict, List, Any, Optional
+from itertools import islice
+from typing import Dict, List, Any, Optional, Set, Tuple
 # DEPRECATED IMPORT - Do not use
 # from langchain.memory import ConversationBufferMemory
 from langchain_core.messages import HumanMessage, AIMessage
+from .keyword_matcher import KeywordMatcher
+from .router_agent import detect_crisis, detect_explicit_intent
+from .cache import normalize_query, get_cached_response, cache_response
 
 
 def get_conversation_context(memory: Any) -> str:
@@ -33,8 +37,12 @@ def get_conversation_context(memory: Any) -> str:
         return ""
     
     formatted = []
-    for msg in messages[-10:]:  # Last 10 messages for context
-        if isinstance(msg, (HumanMessage, dict)):
+    user_types = (HumanMessage, dict)
+    # Last 10 messages for context - islice avoids copying the tail and also
+    # works if the history is a bounded deque
+    count = len(messages)
+    for msg in islice(messages, max(0, count - 10), count):
+        if isinstance(msg, user_types):
             role = "User"
             content = msg.content if hasattr(msg, 'content') else msg.get('content', '')
         else:
@@ -85,27 +93,76 @@ def create_rag_enhanced_prompt(
     Returns:
         Formatted prompt string
     """
-    prompt = ""
+    # Collect sections and join once instead of re-copying the prompt per +=
+    parts = []
     
     if persona_guidelines:
-        prompt += f"{persona_guidelines}\n\n"
+        parts.append(f"{persona_guidelines}\n\n")
     
     if distress_level != "none":
-        prompt += f"⚠️ User Distress Level: {distress_level.upper()}\n"
+        parts.append(f"⚠️ User Distress Level: {distress_level.upper()}\n")
         if distress_level == "high":
-            prompt += "PRIORITY: Provide immediate empathetic support and crisis resources.\n"
-        prompt += "\n"
+            parts.append("PRIORITY: Provide immediate empathetic support and crisis resources.\n")
+        parts.append("\n")
     
     if context:
-        prompt += f"Retrieved Knowledge Base Context:\n{context}\n\n"
+        parts.append(f"Retrieved Knowledge Base Context:\n{context}\n\n")
     
     if conversation_history:
-        prompt += f"Conversation History:\n{conversation_history}\n\n"
+        parts.append(f"Conversation History:\n{conversation_history}\n\n")
     
-    prompt += f"Current User Query: {query}\n\n"
-    prompt += "Provide a supportive, context-aware response:"
+    parts.append(f"Current User Query: {query}\n\n")
+    parts.append("Provide a supportive, context-aware response:")
     
-    return prompt
+    return "".join(parts)
+
+
+# ============================================================================
+# TOOL TRIGGERS - One keyword scan per trigger family; 'trigger' gates the tool,
+# the other categories pick its type (checked in the priority order below)
+# ============================================================================
+
+_CRISIS_TOOL_KEYWORDS = KeywordMatcher({
+    'trigger': ['hotline', 'emergency', 'help now', 'crisis'],
+    'immediate': ['now', 'emergency'],
+})
+
+_RESOURCE_TOOL_KEYWORDS = KeywordMatcher({
+    'trigger': ['find', 'service', 'therapist', 'counselor', 'support group'],
+    'hotline': ['hotline', 'emergency'],
+    'therapy': ['therapy', 'therapist', 'counselor'],
+    'support_group': ['support group', 'group'],
+    'youth': ['youth', 'young'],
+})
+_RESOURCE_TYPE_ORDER = ('hotline', 'therapy', 'support_group', 'youth')
+
+_ASSESSMENT_TOOL_KEYWORDS = KeywordMatcher({
+    'trigger': ['assess', 'screen', 'test', 'check', 'evaluate'],
+    'depression': ['depress'],
+    'anxiety': ['anxi', 'worry'],
+    'stress': ['stress'],
+})
+_ASSESSMENT_TYPE_ORDER = ('depression', 'anxiety', 'stress')
+
+# Breathing and mood triggers apply to any agent, so they share one scan
+_GENERAL_TOOL_KEYWORDS = KeywordMatcher({
+    'breathing': ['breath', 'breathing', 'relax', 'calm down'],
+    'box': ['box'],
+    '478': ['478', '4-7-8'],
+    'deep': ['deep'],
+    'mood': ['mood', 'feeling', 'how am i', 'track'],
+    'log': ['track', 'log'],
+    'analyze': ['pattern', 'analyze'],
+})
+_BREATH_TYPE_ORDER = ('box', '478', 'deep')
+
+
+def _first_match(matched: Set[str], order: Tuple[str, ...], default: str) -> str:
+    """Return the highest-priority category in matched, or default."""
+    for category in order:
+        if category in matched:
+            return category
+    return default
 
 
 def should_use_tool(query: str, agent_type: str) -> Optional[Dict[str, str]]:
@@ -123,74 +180,46 @@ def should_use_tool(query: str, agent_type: str) -> Optional[Dict[str, str]]:
     
     # Crisis agent tool triggers
     if agent_type == "crisis":
-        if any(word in query_lower for word in ['hotline', 'emergency', 'help now', 'crisis']):
+        matched = _CRISIS_TOOL_KEYWORDS.categories(query_lower)
+        if 'trigger' in matched:
             return {
                 "tool": "crisis_hotline",
-                "urgency": "immediate" if 'now' in query_lower or 'emergency' in query_lower else "high"
+                "urgency": "immediate" if 'immediate' in matched else "high"
             }
     
     # Resource agent tool triggers
     elif agent_type == "resource":
-        if any(word in query_lower for word in ['find', 'service', 'therapist', 'counselor', 'support group']):
-            # Determine resource type
-            if 'hotline' in query_lower or 'emergency' in query_lower:
-                resource_type = 'hotline'
-            elif 'therapy' in query_lower or 'therapist' in query_lower or 'counselor' in query_lower:
-                resource_type = 'therapy'
-            elif 'support group' in query_lower or 'group' in query_lower:
-                resource_type = 'support_group'
-            elif 'youth' in query_lower or 'young' in query_lower:
-                resource_type = 'youth'
-            else:
-                resource_type = 'general'
-            
+        matched = _RESOURCE_TOOL_KEYWORDS.categories(query_lower)
+        if 'trigger' in matched:
             return {
                 "tool": "resource_finder",
-                "resource_type": resource_type
+                "resource_type": _first_match(matched, _RESOURCE_TYPE_ORDER, 'general')
             }
     
     # Assessment agent tool triggers
     elif agent_type == "assessment":
-        if any(word in query_lower for word in ['assess', 'screen', 'test', 'check', 'evaluate']):
-            # Determine assessment type
-            if 'depress' in query_lower:
-                assessment_type = 'depression'
-            elif 'anxi' in query_lower or 'worry' in query_lower:
-                assessment_type = 'anxiety'
-            elif 'stress' in query_lower:
-                assessment_type = 'stress'
-            else:
-                assessment_type = 'general'
-            
+        matched = _ASSESSMENT_TOOL_KEYWORDS.categories(query_lower)
+        if 'trigger' in matched:
             return {
                 "tool": "assessment",
-                "assessment_type": assessment_type
+                "assessment_type": _first_match(matched, _ASSESSMENT_TYPE_ORDER, 'general')
             }
     
     # General tool triggers (any agent)
-    if any(word in query_lower for word in ['breath', 'breathing', 'relax', 'calm down']):
-        # Determine breathing type
-        if 'box' in query_lower:
-            breath_type = 'box'
-        elif '478' in query_lower or '4-7-8' in query_lower:
-            breath_type = '478'
-        elif 'deep' in query_lower:
-            breath_type = 'deep'
-        else:
-            breath_type = 'calming'
-        
+    matched = _GENERAL_TOOL_KEYWORDS.categories(query_lower)
+    if 'breathing' in matched:
         return {
             "tool": "breathing",
-            "exercise_type": breath_type
+            "exercise_type": _first_match(matched, _BREATH_TYPE_ORDER, 'calming')
         }
     
-    if any(word in query_lower for word in ['mood', 'feeling', 'how am i', 'track']):
-        if 'track' in query_lower or 'log' in query_lower:
+    if 'mood' in matched:
+        if 'log' in matched:
             return {
                 "tool": "mood_tracker",
                 "action": "log"
             }
-        elif 'pattern' in query_lower or 'analyze' in query_lower:
+        elif 'analyze' in matched:
             return {
                 "tool": "mood_tracker",
                 "action": "analyze"
@@ -237,10 +266,22 @@ def merge_contexts(rag_context: str, external_context: str) -> str:
     return "\n\n---\n\n".join(contexts)
 
 
+# Router intents that map directly onto extract_intent's taxonomy -> urgency
+_QUICK_INTENT_URGENCY = {
+    'assessment': 'moderate',
+    'resource': 'moderate',
+}
+
+
 def extract_intent(query: str, llm) -> Dict[str, Any]:
     """
     Extract user intent using LLM.
     
+    Clear-cut queries (crisis keywords, explicit assessment/resource requests)
+    are classified with the router's keyword rules and never reach the LLM.
+    The LLM's answer for any other query is cached per normalized query, so
+    exact repeats (case/whitespace aside) skip the LLM call as well.
+    
     Args:
         query: User's query
         llm: LLM instance
@@ -248,6 +289,18 @@ def extract_intent(query: str, llm) -> Dict[str, Any]:
     Returns:
         Dictionary with intent information
     """
+    # Rule-based fast path - same keywords the router uses
+    if detect_crisis(query):
+        return {"intent": "crisis", "topic": "", "urgency": "high"}
+    
+    explicit_intent = detect_explicit_intent(query)
+    if explicit_intent in _QUICK_INTENT_URGENCY:
+        return {
+            "intent": explicit_intent,
+            "topic": "",
+            "urgency": _QUICK_INTENT_URGENCY[explicit_intent]
+        }
+    
     from langchain_core.prompts import ChatPromptTemplate
     from langchain_core.output_parsers import StrOutputParser
     
@@ -266,8 +319,13 @@ Example: resource|find therapist|moderate
 
 Analysis:""")
     
-    chain = intent_prompt | llm | StrOutputParser()
-    result = chain.invoke({"query": query})
+    # Shared LLM response cache (cleared on knowledge-base updates with the rest)
+    cache_key = ('intent', normalize_query(query))
+    result = get_cached_response(cache_key)
+    if result is None:
+        chain = intent_prompt | llm | StrOutputParser()
+        result = chain.invoke({"query": query})
+        cache_response(cache_key, result)
     
     parts = result.strip().split('|')
     
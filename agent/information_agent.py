@@ -2,14 +2,25 @@
 Information Agent - Mental health education with evidence-based knowledge
 """
 
-from typing import TypedDict, List
+from typing import TypedDict, List, Optional
+from functools import lru_cache
+import logging
 import os
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from langchain_groq import ChatGroq
-from .sunny_persona import get_sunny_persona, get_distress_responses, build_sunny_prompt
+from .sunny_persona import get_sunny_persona, DISTRESS_RESPONSE_VARIANTS, build_sunny_prompt
+from .cache import generate_query_seed, get_cached_response, cache_response
+from .keyword_matcher import KeywordMatcher
+
+# Configure logger
+logger = logging.getLogger(__name__)
 
 # Optional re-ranker import (can be disabled via env)
 try:
-    from .reranker import rerank_documents
+    from .reranker import rerank_documents, warm_reranker
     RERANKER_AVAILABLE = True
 except ImportError:
     RERANKER_AVAILABLE = False
@@ -23,7 +34,26 @@ USE_RERANKER = (
     os.getenv("RERANKER_ENABLED", "false").lower() == "true"
 ) and RERANKER_AVAILABLE
 
-print(f"🔧 Reranker status: {'ENABLED' if USE_RERANKER else 'DISABLED'}")
+# Load the cross-encoder at startup so the first service turn doesn't pay for it
+if USE_RERANKER:
+    warm_reranker()
+
+logger.info("🔧 Reranker status: %s", "ENABLED" if USE_RERANKER else "DISABLED")
+
+# Separator get_relevant_context puts between retrieved passages
+_CONTEXT_SEPARATOR = "\n\n---\n\n"
+
+
+# Sunny's persona is constant - load it once at import
+_SUNNY = get_sunny_persona()
+
+# Per-branch LLM instructions (the only fixed part of each prompt's tail)
+_SERVICE_TIP_INSTRUCTIONS = "Provide ONE actionable tip (1-2 sentences). Be warm and supportive."
+_SUGGESTION_INSTRUCTIONS = "Suggest the DASS-21 assessment warmly. Explain how it could help them understand their mental health."
+_CASUAL_INSTRUCTIONS = "Respond naturally based on the conversation context. If user affirmed/agreed to something you offered, provide that help. Keep responses warm and concise (2 sentences max)."
+
+# Casual-turn reply when the LLM times out or fails
+_CASUAL_FALLBACK = f"{_SUNNY['validation_phrases'][0]}. What's on your mind? 💙"
 
 
 # ============================================================================
@@ -80,45 +110,55 @@ This really helps calm your nervous system. Give it a try! 😊""",
     }
 }
 
+# Every cached-answer keyword in one scan (category = COMMON_QUERIES topic)
+_COMMON_QUERY_KEYWORDS = KeywordMatcher({
+    topic: data['keywords'] for topic, data in COMMON_QUERIES.items()
+})
+
 
 # ============================================================================
 # OFF-TOPIC DETECTION - Pre-LLM filter (saves LLM calls)
 # ============================================================================
+# Mental health keywords - if any present, likely on-topic
+_MENTAL_HEALTH_KEYWORDS = KeywordMatcher({'on_topic': (
+    'feel', 'feeling', 'emotion', 'anxiety', 'stress', 'depress', 'sad', 'worry',
+    'mental', 'health', 'wellbeing', 'cope', 'help', 'support', 'lonely', 'tired',
+    'overwhelm', 'difficult', 'hard', 'struggle', 'hurt', 'pain', 'upset', 'angry',
+    'scared', 'afraid', 'nervous', 'panic', 'mood', 'sleep', 'therapy', 'counseling'
+)})
+
+# Off-topic indicators (general knowledge, unrelated topics)
+_OFF_TOPIC_KEYWORDS = KeywordMatcher({'off_topic': (
+    'weather', 'temperature', 'forecast', 'rain', 'sunny',
+    'recipe', 'cook', 'food', 'restaurant', 'eat',
+    'movie', 'film', 'tv show', 'actor', 'actress',
+    'sports', 'football', 'soccer', 'basketball',
+    'news', 'politics', 'election', 'president',
+    'stock', 'market', 'investment', 'money',
+    'math', 'calculate', 'equation', 'solve',
+    'history', 'geography', 'science',
+    'translate', 'language',
+    'joke', 'funny', 'entertainment'
+)})
+
+
 def is_off_topic(query: str) -> bool:
     """
     Check if query is off-topic BEFORE LLM call.
     Returns True if query is clearly not about mental health.
     """
-    query_lower = query.lower().strip()
-    
-    # Mental health keywords - if any present, likely on-topic
-    mental_health_keywords = [
-        'feel', 'feeling', 'emotion', 'anxiety', 'stress', 'depress', 'sad', 'worry',
-        'mental', 'health', 'wellbeing', 'cope', 'help', 'support', 'lonely', 'tired',
-        'overwhelm', 'difficult', 'hard', 'struggle', 'hurt', 'pain', 'upset', 'angry',
-        'scared', 'afraid', 'nervous', 'panic', 'mood', 'sleep', 'therapy', 'counseling'
-    ]
-    
-    if any(keyword in query_lower for keyword in mental_health_keywords):
+    return _is_off_topic(query.lower().strip())
+
+
+@lru_cache(maxsize=4096)
+def _is_off_topic(query_lower: str) -> bool:
+    """Memoized off-topic check on the normalized query (repeat turns skip the scans)."""
+    if _MENTAL_HEALTH_KEYWORDS.matches(query_lower):
         return False  # On-topic
     
-    # Off-topic indicators (general knowledge, unrelated topics)
-    off_topic_patterns = [
-        'weather', 'temperature', 'forecast', 'rain', 'sunny',
-        'recipe', 'cook', 'food', 'restaurant', 'eat',
-        'movie', 'film', 'tv show', 'actor', 'actress',
-        'sports', 'football', 'soccer', 'basketball',
-        'news', 'politics', 'election', 'president',
-        'stock', 'market', 'investment', 'money',
-        'math', 'calculate', 'equation', 'solve',
-        'history', 'geography', 'science',
-        'translate', 'language',
-        'joke', 'funny', 'entertainment'
-    ]
-    
     # If query is very short (1-2 words) and has off-topic pattern, likely off-topic
     words = query_lower.split()
-    if len(words) <= 3 and any(pattern in query_lower for pattern in off_topic_patterns):
+    if len(words) <= 3 and _OFF_TOPIC_KEYWORDS.matches(query_lower):
         return True
     
     return False
@@ -129,13 +169,92 @@ def get_cached_answer(query: str) -> str:
     Check if query matches a cached common answer.
     Returns cached answer or empty string if no match.
     """
-    query_lower = query.lower().strip()
+    return _get_cached_answer(query.lower().strip())
+
+
+@lru_cache(maxsize=4096)
+def _get_cached_answer(query_lower: str) -> str:
+    """Memoized common-answer lookup on the normalized query."""
+    matched = _COMMON_QUERY_KEYWORDS.categories(query_lower)
+    if not matched:
+        return ""
     
+    # Several topics can match - the first in COMMON_QUERIES order wins
     for topic, data in COMMON_QUERIES.items():
-        if any(keyword in query_lower for keyword in data['keywords']):
+        if topic in matched:
             return data['answer']
-    
-    return ""
+
+
+# ============================================================================
+# MENU SERVICES - Numbered options with keyword triggers (menu order = priority)
+# ============================================================================
+AGENT_SERVICES = {
+    '1': {
+        'name': 'Understanding feelings',
+        'keywords': ('anxiety', 'stress', 'depression', 'feeling', 'emotion', 'mood', 'sad', 'worried'),
+        'topic': 'understanding emotions and mental health'
+    },
+    '2': {
+        'name': 'Coping strategies',
+        'keywords': ('cope', 'coping', 'manage', 'deal', 'handle', 'breathe', 'relax', 'calm', 'technique'),
+        'topic': 'coping strategies and relaxation techniques'
+    },
+    '3': {
+        'name': 'Support services in Singapore',
+        'keywords': ('support', 'service', 'help', 'singapore', 'chat', 'imh', 'therapy', 'counseling', 'hotline'),
+        'topic': 'Singapore mental health support services'
+    },
+    '4': {
+        'name': 'Just talk',
+        'keywords': ('talk', 'listen', 'chat', 'vent', 'share', 'tell'),
+        'topic': 'conversation and listening support'
+    }
+}
+
+# Numbered menu picks get a vetted reply instantly (no RAG/LLM needed);
+# keyword matches still go through RAG + LLM for a tailored tip
+STATIC_SERVICE_REPLIES = {
+    '1': """Feelings like anxiety, stress or sadness are signals, not flaws - they tell you something needs care. 💙 Try naming what you feel right now ("I'm feeling anxious"); just putting it into words can make it feel more manageable.""",
+    '2': """Here's one you can try right now: breathe in for 4 counts, hold for 4, out for 4, hold for 4 - repeat a few times. 🌬️ Small, steady breaths tell your body it's safe to calm down.""",
+    '3': """You don't have to go through this alone. 💙 In Singapore you can call SOS at 1767 (24/7, free), reach CHAT at 6493-6500 if you're 16-30, or IMH's 24/7 helpline at 6389-2222.""",
+    '4': """I'm all ears. 😊 Tell me what's been on your mind - there's no right or wrong way to say it, and I'm here to listen."""
+}
+
+# One scan over every service keyword; the first service in menu order wins
+_SERVICE_KEYWORDS = KeywordMatcher({
+    service_num: service['keywords'] for service_num, service in AGENT_SERVICES.items()
+})
+
+
+# ============================================================================
+# DISTRESS MENUS - Every opening/context variant rendered once at import
+# ============================================================================
+# Openings differ per variant; the menu under them only depends on the level
+_DISTRESS_MENU_BODIES = {
+    'high': """I can support you with:
+
+1️⃣ Understanding what you're feeling
+2️⃣ Coping strategies that can help right now  
+3️⃣ Connecting you to professional support in Singapore
+4️⃣ Just being here to listen - whatever you need
+
+Type a number (1-4), or just tell me more about what's happening. I'm not going anywhere. 😊""",
+    'mild': """What would you like help with?
+• Understanding emotions
+• Coping strategies  
+• Support services in Singapore
+• Or just talk - I'm a good listener!
+
+What's on your mind today?"""
+}
+
+_DISTRESS_MENUS = {
+    distress_level: tuple(
+        f"{variant['opening']}\n\n{variant['context']}\n\n{_DISTRESS_MENU_BODIES[distress_level]}"
+        for variant in variants
+    )
+    for distress_level, variants in DISTRESS_RESPONSE_VARIANTS.items()
+}
 
 
 class AgentState(TypedDict):
@@ -147,15 +266,80 @@ class AgentState(TypedDict):
     distress_level: str  # 'high', 'moderate', 'mild', or 'none'
 
 
-def _invoke_llm_with_timeout(llm, prompt: str, seed: int, max_tokens: int = 256, timeout: int = 40) -> str:
+# Output caps - replies trimmed to 2 sentences never need more than ~100 tokens,
+# so generation stops early instead of producing text that gets cut
+TRIMMED_REPLY_MAX_TOKENS = 100
+FULL_REPLY_MAX_TOKENS = 150
+
+
+# Sentence boundary: ., ! or ? followed by whitespace - "!"/"?" endings count,
+# and decimals like 4.5 or names like healthhub.sg don't split a sentence
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def _split_sentences(text: str, limit: int) -> List[str]:
+    """Split a reply into sentences, keeping their own end punctuation.
+    
+    Stops after `limit` splits - callers only look at the first few sentences,
+    so the last item holds the (unsplit) rest of a long reply.
+    """
+    return [sentence for sentence in _SENTENCE_END_RE.split(text.strip(), maxsplit=limit) if sentence]
+
+
+def _generate(llm, prompt: str, seed: int, max_tokens: int, max_sentences: Optional[int],
+              cache_prompt: bool = True) -> str:
+    """Run the LLM call, streaming and stopping early when only a few sentences are kept.
+    
+    Completions are cached per exact prompt + settings, so a prompt repeated
+    across sessions (e.g. a first-turn "hello") skips the Groq round-trip.
+    Callers that cache the final reply under their own key pass cache_prompt=False.
+    """
+    cache_key = ('information_llm', prompt, seed, max_tokens, max_sentences)
+    if cache_prompt:
+        cached = get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+    
+    config = {"configurable": {"seed": seed}}
+    
+    # max_tokens goes to the model call itself - as a config key it was ignored
+    if max_sentences is None:
+        response = llm.invoke(prompt, config=config, max_tokens=max_tokens).content.strip()
+    else:
+        # Once a further sentence has started, the first max_sentences are final -
+        # closing the stream there stops generating tokens the trimming would drop
+        text = ""
+        for chunk in llm.stream(prompt, config=config, max_tokens=max_tokens):
+            text += chunk.content
+            if len(_split_sentences(text, max_sentences)) > max_sentences:
+                break
+        response = text.strip()
+    
+    if cache_prompt:
+        cache_response(cache_key, response)
+    return response
+
+
+# LLM calls run on a bounded worker pool so the timeout holds on any thread and OS
+# (SIGALRM only fires on the main thread, never on Flask request threads). Size it
+# to the server's concurrent requests: a timed-out call keeps its worker until the
+# client's 40s HTTP timeout ends it, and time queued for a worker counts too
+LLM_MAX_WORKERS = int(os.getenv("LLM_MAX_WORKERS", "16"))
+_LLM_EXECUTOR = ThreadPoolExecutor(max_workers=LLM_MAX_WORKERS, thread_name_prefix="info-llm")
+
+
+def _invoke_llm_with_timeout(llm, prompt: str, seed: int, max_tokens: int = FULL_REPLY_MAX_TOKENS, timeout: int = 40,
+                             max_sentences: Optional[int] = None, cache_prompt: bool = True) -> str:
     """Invoke LLM with timeout protection for Render free tier.
     
     Args:
         llm: ChatGroq LLM instance
         prompt: Prompt to send to LLM
         seed: Deterministic seed
-        max_tokens: Maximum tokens to generate (default 256 for speed)
+        max_tokens: Maximum tokens to generate (default 150, the app-wide cap)
         timeout: Timeout in seconds (default 40s)
+        max_sentences: If set, stream and stop once this many sentences are complete
+        cache_prompt: Cache the completion per exact prompt (see _generate)
     
     Returns:
         Generated response text
@@ -163,41 +347,12 @@ def _invoke_llm_with_timeout(llm, prompt: str, seed: int, max_tokens: int = 256,
     Raises:
         TimeoutError: If LLM call exceeds timeout
     """
-    import signal
-    
-    def timeout_handler(signum, frame):
-        raise TimeoutError(f"LLM call exceeded {timeout}s timeout")
-    
-    # Set up timeout (Unix-only, won't work on Windows)
+    future = _LLM_EXECUTOR.submit(_generate, llm, prompt, seed, max_tokens, max_sentences, cache_prompt)
     try:
-        old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout)
-        
-        try:
-            response = llm.invoke(
-                prompt,
-                config={
-                    "configurable": {"seed": seed},
-                    "max_tokens": max_tokens  # Cap tokens for speed
-                }
-            ).content.strip()
-            
-            return response
-        finally:
-            # Cancel timeout
-            signal.alarm(0)
-            signal.signal(signal.SIGALRM, old_handler)
-            
-    except AttributeError:
-        # signal.SIGALRM not available (Windows) - just call without timeout
-        response = llm.invoke(
-            prompt,
-            config={
-                "configurable": {"seed": seed},
-                "max_tokens": max_tokens
-            }
-        ).content.strip()
-        return response
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        future.cancel()  # Drops it if still queued; a running call can't be interrupted
+        raise TimeoutError(f"LLM call exceeded {timeout}s timeout")
 
 
 def information_agent_node(state: AgentState, llm: ChatGroq, get_relevant_context) -> AgentState:
@@ -206,22 +361,27 @@ def information_agent_node(state: AgentState, llm: ChatGroq, get_relevant_contex
     Performance optimizations for Render free tier:
     - Detailed timing logs with [INFO_AGENT] prefix
     - Truncate long messages before processing (512 chars max)
-    - Cap LLM max_tokens to 256
+    - Cap LLM max_tokens to 100 for trimmed replies (150 otherwise)
     - Timeout wrapper around LLM calls (40s max)
     - Retriever k=3 for speed
     """
-    import time
-    import logging
-    
-    # Get logger (use app.logger if available, otherwise use print)
+    # Get logger (use app.logger if available, otherwise the module logger)
     try:
         from flask import current_app
         logger = current_app.logger
-    except:
+    except (ImportError, RuntimeError):  # Flask not installed / outside an app context
         logger = logging.getLogger(__name__)
     
     agent_start = time.time()
-    logger.info("[INFO_AGENT] 🚀 Information agent started")
+    logger.debug("[INFO_AGENT] 🚀 Information agent started")
+    
+    def finish(response: str, outcome: str) -> AgentState:
+        """Single exit point: record the reply and log total latency."""
+        elapsed = time.time() - agent_start
+        logger.info("[INFO_AGENT] %s in %.3fs (%d chars)", outcome, elapsed, len(response))
+        state["messages"].append(response)
+        state["current_agent"] = "complete"
+        return state
     
     query = state["current_query"]
     conversation_history = state.get("messages", [])
@@ -232,141 +392,94 @@ def information_agent_node(state: AgentState, llm: ChatGroq, get_relevant_contex
     original_query_len = len(query)
     if len(query) > 512:
         query = query[:512]
-        logger.info(f"[INFO_AGENT] ✂️  Truncated query from {original_query_len} to 512 chars")
+        logger.info("[INFO_AGENT] ✂️  Truncated query from %d to 512 chars", original_query_len)
     
-    # Load Sunny's persona components
-    sunny = get_sunny_persona()
-    distress_responses = get_distress_responses()
+    # Normalize once - menu picks use the stripped text, keyword checks the lowercase
+    query_stripped = query.strip()
+    query_lower = query_stripped.lower()
     
-    logger.info(f"[INFO_AGENT] 📝 Query: '{query[:50]}...' | Distress: {distress_level}")
+    logger.debug("[INFO_AGENT] 📝 Query: '%.50s...' | Distress: %s", query, distress_level)
+    
+    # Use distress level from router (SIMPLIFIED 2-LEVEL SYSTEM)
+    sounds_unstable = distress_level in ['high', 'mild']
+    
+    # Numbered menu picks need no other check - answer before any keyword scan
+    static_reply = None if sounds_unstable else STATIC_SERVICE_REPLIES.get(query_stripped)
+    if static_reply:
+        return finish(f"{static_reply}\n\n💬 *Want to know more? Just ask!*", "⚡ Static menu reply returned")
     
     # ========================================================================
     # OPTIMIZATION 1: Check cached answers first (instant response, no LLM/DB)
     # ========================================================================
-    cached_answer = get_cached_answer(query)
+    cached_answer = _get_cached_answer(query_lower)
     if cached_answer and distress_level == 'none':
-        elapsed = time.time() - agent_start
-        logger.info(f"[INFO_AGENT] ⚡ CACHED response returned in {elapsed:.3f}s")
-        state["messages"].append(cached_answer)
-        state["current_agent"] = "complete"
-        return state
+        return finish(cached_answer, "⚡ CACHED response returned")
     
     # ========================================================================
     # OPTIMIZATION 2: Off-topic detection (skip LLM/DB for unrelated queries)
     # ========================================================================
-    if is_off_topic(query) and distress_level == 'none':
-        elapsed = time.time() - agent_start
-        logger.info(f"[INFO_AGENT] 🚫 OFF-TOPIC detected, redirect in {elapsed:.3f}s")
-        state["messages"].append(sunny['redirect_template'])
-        state["current_agent"] = "complete"
-        return state
+    if _is_off_topic(query_lower) and distress_level == 'none':
+        return finish(_SUNNY['redirect_template'], "🚫 OFF-TOPIC detected, redirect")
     
-    # Use distress level from router (SIMPLIFIED 2-LEVEL SYSTEM)
-    sounds_unstable = distress_level in ['high', 'mild']
-    
-    # Define agent services with keywords/numbers
-    agent_services = {
-        '1': {
-            'name': 'Understanding feelings',
-            'keywords': ['anxiety', 'stress', 'depression', 'feeling', 'emotion', 'mood', 'sad', 'worried'],
-            'topic': 'understanding emotions and mental health'
-        },
-        '2': {
-            'name': 'Coping strategies',
-            'keywords': ['cope', 'coping', 'manage', 'deal', 'handle', 'breathe', 'relax', 'calm', 'technique'],
-            'topic': 'coping strategies and relaxation techniques'
-        },
-        '3': {
-            'name': 'Support services in Singapore',
-            'keywords': ['support', 'service', 'help', 'singapore', 'chat', 'imh', 'therapy', 'counseling', 'hotline'],
-            'topic': 'Singapore mental health support services'
-        },
-        '4': {
-            'name': 'Just talk',
-            'keywords': ['talk', 'listen', 'chat', 'vent', 'share', 'tell'],
-            'topic': 'conversation and listening support'
-        }
-    }
-    
-    # Check if user selected a number or mentioned keywords
+    # Check if user mentioned a service's keywords
     selected_service = None
     
-    if query.strip() in ['1', '2', '3', '4']:
-        selected_service = agent_services[query.strip()]
-        logger.info(f"[INFO_AGENT] ✅ Menu selection: {selected_service['name']}")
-    elif not sounds_unstable:
-        query_lower = query.lower()
-        for service_num, service in agent_services.items():
-            if any(keyword in query_lower for keyword in service['keywords']):
-                selected_service = service
-                logger.info(f"[INFO_AGENT] 🔍 Keyword match: {selected_service['name']}")
-                break
+    if not sounds_unstable:
+        matched = _SERVICE_KEYWORDS.categories(query_lower)
+        service_num = next((num for num in AGENT_SERVICES if num in matched), None)
+        if service_num:
+            selected_service = AGENT_SERVICES[service_num]
+            logger.debug("[INFO_AGENT] 🔍 Keyword match: %s", selected_service['name'])
     
     # Flow logic - DISTRESS TAKES PRIORITY
     if sounds_unstable:
         # User is distressed - show response based on distress level
-        logger.info(f"[INFO_AGENT] 😔 Distress response: {distress_level}")
+        logger.debug("[INFO_AGENT] 😔 Distress response: %s", distress_level)
         
-        distress_response = distress_responses[distress_level]
+        # Random variant per call - keeps Sunny's openings varied
+        response = random.choice(_DISTRESS_MENUS[distress_level])
         
-        if distress_level == 'high':
-            response = f"""{distress_response['opening']}
-
-{distress_response['context']}
-
-I can support you with:
-
-1️⃣ Understanding what you're feeling
-2️⃣ Coping strategies that can help right now  
-3️⃣ Connecting you to professional support in Singapore
-4️⃣ Just being here to listen - whatever you need
-
-Type a number (1-4), or just tell me more about what's happening. I'm not going anywhere. 😊"""
-        else:  # mild distress
-            response = f"""{distress_response['opening']}
-
-{distress_response['context']}
-
-What would you like help with?
-• Understanding emotions
-• Coping strategies  
-• Support services in Singapore
-• Or just talk - I'm a good listener!
-
-What's on your mind today?"""
-        
-        elapsed = time.time() - agent_start
-        logger.info(f"[INFO_AGENT] ✅ Distress menu returned in {elapsed:.3f}s")
-        state["messages"].append(response)
-        state["current_agent"] = "complete"
-        return state
+        return finish(response, "✅ Distress menu returned")
         
     elif selected_service:
-        # User selected a service - provide relevant info with RAG
-        logger.info(f"[INFO_AGENT] 💡 Selected service: {selected_service['topic']}")
+        # User mentioned a service - provide relevant info with RAG
+        logger.debug("[INFO_AGENT] 💡 Selected service: %s", selected_service['topic'])
+        
+        # Service topics are fixed, so the final answer depends only on the service
+        # and the seed - repeated keyword queries skip both RAG and the LLM
+        query_seed = generate_query_seed(query)
+        cache_key = ('information_service', selected_service['name'], query_seed)
+        cached_response = get_cached_response(cache_key)
+        if cached_response is not None:
+            return finish(cached_response, "⚡ Cached service response returned")
         
         # TIMING: RAG retrieval
         rag_start = time.time()
-        logger.info(f"[INFO_AGENT] 🔍 Starting RAG retrieval (k=3)")
+        logger.debug("[INFO_AGENT] 🔍 Starting RAG retrieval (k=3)")
         
         # Get context with k=3 for speed on Render
         raw_context = get_relevant_context(selected_service['topic'], n_results=3)
         
         rag_duration = time.time() - rag_start
-        logger.info(f"[INFO_AGENT] ✅ RAG retrieval completed in {rag_duration:.3f}s")
+        logger.info("[INFO_AGENT] ✅ RAG retrieval completed in %.3fs", rag_duration)
         
-        # Re-rank if enabled (usually disabled on Render)
-        if USE_RERANKER:
+        # Re-rank if enabled (usually disabled on Render). The retrieved passages
+        # come back joined, so split them out - reranking a single doc is a no-op
+        passages = raw_context.split(_CONTEXT_SEPARATOR) if USE_RERANKER else ()
+        if len(passages) > 1:
             rerank_start = time.time()
-            docs = [{"text": raw_context, "source": "knowledge_base"}]
+            docs = [{"text": passage, "source": "knowledge_base"} for passage in passages]
             reranked_docs = rerank_documents(
                 query=selected_service['topic'],
                 documents=docs,
                 document_key="text"
             )
-            info_context = reranked_docs[0]["text"] if reranked_docs else raw_context
+            info_context = (
+                _CONTEXT_SEPARATOR.join(doc["text"] for doc in reranked_docs)
+                if reranked_docs else raw_context
+            )
             rerank_duration = time.time() - rerank_start
-            logger.info(f"[INFO_AGENT] 🔄 Re-ranking completed in {rerank_duration:.3f}s")
+            logger.info("[INFO_AGENT] 🔄 Re-ranked %d passages in %.3fs", len(docs), rerank_duration)
         else:
             info_context = raw_context
         
@@ -374,118 +487,105 @@ What's on your mind today?"""
         prompt = build_sunny_prompt(
             agent_type='information',
             context=f"Topic: {selected_service['name']}\n\nKnowledge: {info_context}",
-            specific_instructions="Provide ONE actionable tip (1-2 sentences). Be warm and supportive."
+            specific_instructions=_SERVICE_TIP_INSTRUCTIONS
         )
         
         # TIMING: LLM generation with timeout
         llm_start = time.time()
-        logger.info("[INFO_AGENT] 🤖 Starting LLM generation (max_tokens=256, timeout=40s)")
+        logger.debug("[INFO_AGENT] 🤖 Starting LLM generation (max_tokens=%d, timeout=40s)", TRIMMED_REPLY_MAX_TOKENS)
         
         try:
-            # Generate deterministic seed
-            import hashlib
-            query_seed = int(hashlib.md5(query.lower().strip().encode()).hexdigest()[:8], 16)
-            
             # Call LLM with timeout wrapper
             response = _invoke_llm_with_timeout(
                 llm=llm,
                 prompt=prompt,
                 seed=query_seed,
-                max_tokens=256,
-                timeout=40
+                max_tokens=TRIMMED_REPLY_MAX_TOKENS,
+                timeout=40,
+                max_sentences=2,
+                cache_prompt=False  # Cached below per service + seed, ahead of RAG
             )
             
             llm_duration = time.time() - llm_start
-            logger.info(f"[INFO_AGENT] ✅ LLM generation completed in {llm_duration:.3f}s ({len(response)} chars)")
+            logger.info("[INFO_AGENT] ✅ LLM generation completed in %.3fs (%d chars)", llm_duration, len(response))
             
             # Hard limit - only first 2 sentences
-            sentences = [s.strip() for s in response.split('.') if s.strip()]
+            sentences = _split_sentences(response, 2)
             if len(sentences) > 2:
-                response = '. '.join(sentences[:2]) + '.'
+                response = ' '.join(sentences[:2])
             
             response = f"{response}\n\n💬 *Want to know more? Just ask!*"
+            cache_response(cache_key, response)
             
         except TimeoutError:
-            logger.error(f"[INFO_AGENT] ⏰ LLM timeout after 40s - using fallback")
+            logger.error("[INFO_AGENT] ⏰ LLM timeout after 40s - using fallback")
             response = f"I can help with {selected_service['name'].lower()}. What would you like to know?"
         except Exception as e:
-            logger.error(f"[INFO_AGENT] ❌ LLM error: {e}")
+            logger.error("[INFO_AGENT] ❌ LLM error: %s", e)
             response = f"I can help with {selected_service['name'].lower()}. What would you like to know?"
         
-        elapsed = time.time() - agent_start
-        logger.info(f"[INFO_AGENT] ✅ Service response completed in {elapsed:.3f}s")
-        state["messages"].append(response)
-        state["current_agent"] = "complete"
-        return state
+        return finish(response, "✅ Service response completed")
         
     else:
         # Normal conversation - be friendly and supportive
-        logger.info("[INFO_AGENT] 💬 Casual conversation mode")
+        logger.debug("[INFO_AGENT] 💬 Casual conversation mode")
         
         # Build context including conversation history and external context
-        context_parts = [f'User said: "{query}"']
+        full_context = f'User said: "{query}"'
         
         # Include recent conversation history for context (last 3 exchanges)
         if len(conversation_history) >= 2:
             recent_history = "\n".join(conversation_history[-3:])
-            context_parts.append(f"Recent conversation:\n{recent_history}")
+            full_context = f"{full_context}\n\nRecent conversation:\n{recent_history}"
         
         if external_context:
-            context_parts.append(external_context)
-            logger.info("[INFO_AGENT] 🎯 Including external context")
-        
-        full_context = '\n\n'.join(context_parts)
+            full_context = f"{full_context}\n\n{external_context}"
+            logger.debug("[INFO_AGENT] 🎯 Including external context")
         
         # Check if we're suggesting an assessment
         is_assessment_suggestion = external_context and "ASSESSMENT_SUGGESTION" in external_context
         
-        if is_assessment_suggestion:
-            prompt = build_sunny_prompt(
-                agent_type='information',
-                context=full_context,
-                specific_instructions="Suggest the DASS-21 assessment warmly. Explain how it could help them understand their mental health."
-            )
-        else:
-            prompt = build_sunny_prompt(
-                agent_type='information',
-                context=full_context,
-                specific_instructions="Respond naturally based on the conversation context. If user affirmed/agreed to something you offered, provide that help. Keep responses warm and concise (2-3 sentences max)."
+        prompt = build_sunny_prompt(
+            agent_type='information',
+            context=full_context,
+            specific_instructions=(
+                _SUGGESTION_INSTRUCTIONS if is_assessment_suggestion else _CASUAL_INSTRUCTIONS
             )
-    
+        )
+        
+        # Suggestions are sent in full; normal replies are trimmed to 2 sentences
+        max_tokens = FULL_REPLY_MAX_TOKENS if is_assessment_suggestion else TRIMMED_REPLY_MAX_TOKENS
+        
         # TIMING: LLM generation with timeout
         llm_start = time.time()
-        logger.info("[INFO_AGENT] 🤖 Starting LLM generation (max_tokens=256, timeout=40s)")
+        logger.debug("[INFO_AGENT] 🤖 Starting LLM generation (max_tokens=%d, timeout=40s)", max_tokens)
         
         try:
-            import hashlib
-            query_seed = int(hashlib.md5(query.lower().strip().encode()).hexdigest()[:8], 16)
+            query_seed = generate_query_seed(query)
             
             # Call LLM with timeout wrapper
             response = _invoke_llm_with_timeout(
                 llm=llm,
                 prompt=prompt,
                 seed=query_seed,
-                max_tokens=256,
-                timeout=40
+                max_tokens=max_tokens,
+                timeout=40,
+                max_sentences=None if is_assessment_suggestion else 2
             )
             
             llm_duration = time.time() - llm_start
-            logger.info(f"[INFO_AGENT] ✅ LLM generation completed in {llm_duration:.3f}s ({len(response)} chars)")
+            logger.info("[INFO_AGENT] ✅ LLM generation completed in %.3fs (%d chars)", llm_duration, len(response))
             
             # Apply hard limit for normal responses only
             if not is_assessment_suggestion:
-                sentences = [s.strip() for s in response.split('.') if s.strip()]
-                response = '. '.join(sentences[:2]) + '.' if sentences else "I'm here for you. What's on your mind?"
+                sentences = _split_sentences(response, 2)
+                response = ' '.join(sentences[:2]) if sentences else "I'm here for you. What's on your mind?"
             
         except TimeoutError:
-            logger.error(f"[INFO_AGENT] ⏰ LLM timeout after 40s - using fallback")
-            response = f"{sunny['validation_phrases'][0]}. What's on your mind? 💙"
+            logger.error("[INFO_AGENT] ⏰ LLM timeout after 40s - using fallback")
+            response = _CASUAL_FALLBACK
         except Exception as e:
-            logger.error(f"[INFO_AGENT] ❌ LLM error: {e}")
-            response = f"{sunny['validation_phrases'][0]}. What's on your mind? 💙"
+            logger.error("[INFO_AGENT] ❌ LLM error: %s", e)
+            response = _CASUAL_FALLBACK
         
-        elapsed = time.time() - agent_start
-        logger.info(f"[INFO_AGENT] ✅ Conversation response completed in {elapsed:.3f}s")
-        state["messages"].append(response)
-        state["current_agent"] = "complete"
-        return state
\ No newline at end of file
+        return finish(response, "✅ Conversation response completed")
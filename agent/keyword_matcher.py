@@ -0,0 +1,73 @@
+"""
+Keyword Matcher - Single-pass multi-category keyword detection
+Replaces repeated any(keyword in query_lower ...) scans on agent fast paths
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, Mapping, Set
+
+
+class KeywordMatcher:
+    """
+    Match many keyword lists against a query in ONE C-level scan.
+
+    All keywords are compiled (longest first) into a single regex alternation
+    wrapped in a lookahead, so every start position of the query is visited
+    once and overlapping keywords are still found - Aho-Corasick style matching
+    without an extra dependency. Semantics are plain substring matching, exactly
+    like `keyword in query_lower`.
+
+    The pattern is an alternation of escaped literals, so the stdlib engine
+    cannot backtrack catastrophically on adversarial input. re2/Hyperscan are
+    not used: re2 has no lookahead, which the overlapping matches rely on.
+    """
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]):
+        """
+        Args:
+            categories: Mapping of category name -> keywords (already lowercase)
+        """
+        keyword_categories: Dict[str, Set[str]] = {}
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                keyword_categories.setdefault(keyword, set()).add(category)
+
+        # Once every category has matched, categories() can stop scanning early
+        self._category_count = len(categories)
+
+        # Text shorter than the shortest keyword cannot match - skip the regex
+        self._min_length = min(map(len, keyword_categories), default=0)
+
+        # The alternation reports the longest keyword at each position, so fold in
+        # the categories of shorter keywords that are a prefix of it (they matched too)
+        self._categories: Dict[str, FrozenSet[str]] = {
+            keyword: frozenset().union(*(
+                cats for other, cats in keyword_categories.items()
+                if keyword.startswith(other)
+            ))
+            for keyword in keyword_categories
+        }
+
+        ordered = sorted(keyword_categories, key=len, reverse=True)
+        if ordered:
+            alternation = '|'.join(re.escape(keyword) for keyword in ordered)
+            self._pattern = re.compile(f'(?=({alternation}))')
+        else:
+            self._pattern = re.compile(r'(?!)')  # Never matches
+
+    def categories(self, text: str) -> Set[str]:
+        """Return every category with at least one keyword present in text."""
+        found: Set[str] = set()
+        if len(text) < self._min_length:
+            return found
+        for match in self._pattern.finditer(text):
+            found |= self._categories[match.group(1)]
+            if len(found) == self._category_count:
+                break  # Nothing left to find - skip the rest of the text
+        return found
+
+    def matches(self, text: str) -> bool:
+        """Return True if any keyword is present in text."""
+        if len(text) < self._min_length:
+            return False
+        return self._pattern.search(text) is not None
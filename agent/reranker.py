@@ -222,6 +222,19 @@ def get_reranker(
     return _reranker_instance
 
 
+def warm_reranker() -> bool:
+    """
+    Load the cross-encoder now instead of on the first re-rank request.
+    
+    Call once at startup when re-ranking is enabled, so the first user
+    doesn't pay the model load.
+    
+    Returns:
+        True if the re-ranker is enabled and its model is loaded
+    """
+    return get_reranker().is_enabled()
+
+
 def reset_reranker() -> None:
     """Reset the global re-ranker instance (useful for testing)."""
     global _reranker_instance
@@ -5,6 +5,7 @@ Resource Agent - Singapore mental health services and support
 from typing import TypedDict, List
 from langchain_groq import ChatGroq
 from .sunny_persona import build_sunny_prompt
+from .cache import generate_query_seed
 import logging
 import os
 
@@ -235,8 +236,7 @@ Format exactly as shown. Be concise."""
     )
     
     try:
-        import hashlib
-        query_seed = int(hashlib.md5(query.lower().strip().encode()).hexdigest()[:8], 16)
+        query_seed = generate_query_seed(query)
         
         response = llm.invoke(
             prompt,
@@ -3,6 +3,8 @@ Sunny Persona Utilities
 Centralized personality and response patterns for consistent agent behavior
 """
 
+from functools import lru_cache
+
 # ============================================================================
 # SHARED SYSTEM PROMPT - Reuse across all LLM calls to save tokens
 # ============================================================================
@@ -15,8 +17,12 @@ Style: Use validation ("I hear you", "That's tough") and encouragement ("You've
 Respond with warmth and care."""
 
 
+@lru_cache(maxsize=1)
 def get_sunny_persona():
-    """Get Sunny's core personality traits for agent prompts - SIMPLIFIED."""
+    """Get Sunny's core personality traits for agent prompts - SIMPLIFIED.
+    
+    Memoized: the persona is constant, so every caller shares one (read-only) dict.
+    """
     return {
         'name': 'Sunny',
         'role': 'caring mental health friend',
@@ -37,51 +43,59 @@ def get_sunny_persona():
         'redirect_template': "Hey! I'm here to chat about how you're feeling. What's on your mind? 😊"
     }
 
+# ============================================================================
+# DISTRESS RESPONSES - Opening/context variants per distress level
+# ============================================================================
+_HIGH_DISTRESS_RESPONSES = (
+    {
+        'opening': "I hear you, and I'm really glad you reached out to me. 💙",
+        'context': "It sounds like you're going through a really tough time right now. I'm Sunny, and I'm here with you, okay? I want you to know that you're not alone in this."
+    },
+    {
+        'opening': "Thank you for trusting me with how you're feeling right now. 💙",
+        'context': "I can hear that things are really hard for you. I'm Sunny, and I want you to know that I'm here to support you through this difficult moment."
+    },
+    {
+        'opening': "I'm so glad you reached out - that took real strength. 💙",
+        'context': "It sounds like you're carrying something really heavy right now. I'm Sunny, and I want you to know that you don't have to face this alone."
+    },
+    {
+        'opening': "I hear the pain in your words, and I'm here with you. 💙",
+        'context': "Whatever you're going through right now feels overwhelming, and that's okay. I'm Sunny, and I want to help you find some support and relief."
+    }
+)
+
+_MILD_DISTRESS_RESPONSES = (
+    {
+        'opening': "Hi there! I'm Sunny, and I'm here to support you. 💙 😊",
+        'context': "I'm glad you reached out - that's always a good step! I'm here to help however I can."
+    },
+    {
+        'opening': "Hey! I'm Sunny, and I can hear that something's on your mind. 😊",
+        'context': "It sounds like you might be going through a bit of a rough patch. That's totally normal, and I'm here to chat about it with you."
+    },
+    {
+        'opening': "Hi! I'm Sunny, and I'm glad you decided to talk about how you're feeling. 😊",
+        'context': "Sometimes life throws us some curveballs, doesn't it? I'm here to listen and maybe help you work through whatever's going on."
+    },
+    {
+        'opening': "Hello! I'm Sunny, and I can sense you might need some support today. 😊 💙",
+        'context': "I'm really glad you're here - reaching out when we're struggling is actually pretty brave. Let's see how I can help."
+    }
+)
+
+DISTRESS_RESPONSE_VARIANTS = {
+    'high': _HIGH_DISTRESS_RESPONSES,
+    'mild': _MILD_DISTRESS_RESPONSES
+}
+
 def get_distress_responses():
     """Get Sunny's varied responses for different distress levels - SIMPLIFIED 2-LEVEL SYSTEM."""
     import random
     
-    high_responses = [
-        {
-            'opening': "I hear you, and I'm really glad you reached out to me. 💙",
-            'context': "It sounds like you're going through a really tough time right now. I'm Sunny, and I'm here with you, okay? I want you to know that you're not alone in this."
-        },
-        {
-            'opening': "Thank you for trusting me with how you're feeling right now. 💙",
-            'context': "I can hear that things are really hard for you. I'm Sunny, and I want you to know that I'm here to support you through this difficult moment."
-        },
-        {
-            'opening': "I'm so glad you reached out - that took real strength. 💙",
-            'context': "It sounds like you're carrying something really heavy right now. I'm Sunny, and I want you to know that you don't have to face this alone."
-        },
-        {
-            'opening': "I hear the pain in your words, and I'm here with you. 💙",
-            'context': "Whatever you're going through right now feels overwhelming, and that's okay. I'm Sunny, and I want to help you find some support and relief."
-        }
-    ]
-    
-    mild_responses = [
-        {
-            'opening': "Hi there! I'm Sunny, and I'm here to support you. 💙 😊",
-            'context': "I'm glad you reached out - that's always a good step! I'm here to help however I can."
-        },
-        {
-            'opening': "Hey! I'm Sunny, and I can hear that something's on your mind. 😊",
-            'context': "It sounds like you might be going through a bit of a rough patch. That's totally normal, and I'm here to chat about it with you."
-        },
-        {
-            'opening': "Hi! I'm Sunny, and I'm glad you decided to talk about how you're feeling. 😊",
-            'context': "Sometimes life throws us some curveballs, doesn't it? I'm here to listen and maybe help you work through whatever's going on."
-        },
-        {
-            'opening': "Hello! I'm Sunny, and I can sense you might need some support today. 😊 💙",
-            'context': "I'm really glad you're here - reaching out when we're struggling is actually pretty brave. Let's see how I can help."
-        }
-    ]
-    
     return {
-        'high': random.choice(high_responses),
-        'mild': random.choice(mild_responses)
+        'high': random.choice(_HIGH_DISTRESS_RESPONSES),
+        'mild': random.choice(_MILD_DISTRESS_RESPONSES)
     }
 
 def get_boundary_statements():
@@ -130,12 +144,9 @@ def build_sunny_prompt(agent_type, context="", specific_instructions=""):
     Build a standardized Sunny persona prompt for any agent.
     Uses shared SUNNY_SYSTEM_PROMPT to save tokens on repeated calls.
     """
-    agent_style = get_agent_specific_style(agent_type)
-    
-    # Use shared system prompt + minimal agent-specific details
-    prompt = f"""{SUNNY_SYSTEM_PROMPT}
-
-Focus: {agent_style['focus']} | Tone: {agent_style['tone']}
+    # Static persona block first, per-turn context after - keeps the prefix
+    # byte-identical so provider-side prompt (prefix) caching can reuse it
+    prompt = f"""{_sunny_prompt_prefix(agent_type)}
 
 {context}
 
@@ -143,6 +154,15 @@ Focus: {agent_style['focus']} | Tone: {agent_style['tone']}
     
     return prompt
 
+
+@lru_cache(maxsize=None)
+def _sunny_prompt_prefix(agent_type):
+    """Shared system prompt + agent style line, built once per agent type."""
+    agent_style = get_agent_specific_style(agent_type)
+    return f"""{SUNNY_SYSTEM_PROMPT}
+
+Focus: {agent_style['focus']} | Tone: {agent_style['tone']}"""
+
 def get_singapore_context():
     """Get Singapore-specific mental health context for Sunny."""
     return {
@@ -5,6 +5,7 @@ A multi-agent system using LangGraph and ChromaDB for knowledge-grounded respons
 """
 
 import os
+import logging
 
 # Safety environment flags
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
@@ -18,6 +19,9 @@ from langchain_huggingface import HuggingFaceEndpointEmbeddings
 from typing import TypedDict, List, Dict, Any
 from dotenv import load_dotenv
 
+# Per-request retrieval diagnostics go through logging (startup banners stay as prints)
+logger = logging.getLogger(__name__)
+
 # Simple ConversationBufferMemory replacement (langchaibbn 1.0+ removed memory module)
 class ConversationBufferMemory:
     """Simple conversation memory to replace deprecated langchain.memory.ConversationBufferMemory"""
@@ -71,6 +75,7 @@ from agent import (
     assessment_agent_node,
     human_escalation_node
 )
+from agent.cache import LRUCache, normalize_query, llm_response_cache
 
 # Load environment variables
 load_dotenv()
@@ -111,6 +116,9 @@ def get_embeddings():
 # Global retriever instance
 retriever = None
 
+# Retrieval cache: normalized query -> retrieved documents (15 min TTL)
+context_cache = LRUCache(maxsize=1024, ttl=900)
+
 # Global memory store for sessions (session_id -> memory)
 session_memories: Dict[str, ConversationBufferMemory] = {}
 
@@ -182,7 +190,7 @@ class AgentState(TypedDict):
     memory: ConversationBufferMemory  # Conversation memory instance
 
 # Initialize Groq LLM
-def get_llm():
+def get_llm(max_retries: int = 2):
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         raise ValueError("GROQ_API_KEY not found in environment variables")
@@ -190,42 +198,53 @@ def get_llm():
         model="llama-3.3-70b-versatile",
         temperature=0.1,  # Low temperature for consistency with natural variation
         max_tokens=150,  # Limit response length
+        timeout=40,  # Bound each API call
+        max_retries=max_retries,  # Groq client default (2) unless a caller needs a hard bound
         api_key=api_key
     )
 
-def generate_query_seed(query: str) -> int:
-    """Generate deterministic seed from query for consistent but varied responses."""
-    import hashlib
-    # Create hash of query text for deterministic seeding
-    hash_object = hashlib.md5(query.lower().strip().encode())
-    # Convert first 8 bytes to int for seed
-    return int(hash_object.hexdigest()[:8], 16)
-
+# One shared client for the agent wrappers and chains - keeps the Groq HTTP
+# connection pool warm across turns instead of reconnecting per request
 llm = get_llm()
 
+# The information agent gives up on a call after 40s; without client retries the
+# abandoned call also ends at the 40s HTTP timeout instead of retrying behind it
+information_llm = get_llm(max_retries=0)
+
 # RAG Helper Functions
 def get_relevant_context(query: str, n_results: int = 2) -> str:
     """Retrieve relevant context using LangChain Retriever (optimized with timing).
     
     IMPORTANT: Retriever is initialized once at module level for performance.
     This function just queries the pre-built retriever.
+    Retrieved documents are cached per normalized query (independent of
+    n_results), so repeats skip embedding + search.
     """
     global retriever
     
     if retriever is None:
         return "Retriever not initialized."
     
+    cache_key = normalize_query(query)
+    docs = context_cache.get(cache_key)
+    
     try:
-        import time
-        
-        # Time the retrieval operation
-        retrieval_start = time.time()
-        
-        # Use LangChain retriever (invoke method for compatibility)
-        docs = retriever.invoke(query)
-        
-        retrieval_duration = time.time() - retrieval_start
-        print(f"⏱️  ChromaDB retrieval took {retrieval_duration:.3f}s for query: '{query[:50]}...'")
+        if docs is not None:
+            logger.debug("⚡ Retrieval cache hit for query: '%.50s...'", query)
+        else:
+            import time
+            
+            # Time the retrieval operation
+            retrieval_start = time.time()
+            
+            # Use LangChain retriever (invoke method for compatibility)
+            docs = tuple(retriever.invoke(query))
+            
+            retrieval_duration = time.time() - retrieval_start
+            logger.info("⏱️  ChromaDB retrieval took %.3fs for query: '%.50s...'", retrieval_duration, query)
+            
+            # Only successful lookups are cached (errors fall through to except)
+            context_cache.set(cache_key, docs)
         
         if docs:
             # Format retrieved documents (limit to n_results)
@@ -235,12 +254,13 @@ def get_relevant_context(query: str, n_results: int = 2) -> str:
                 context_pieces.append(f"[Source: {source}]\n{doc.page_content}")
             
             result = "\n\n---\n\n".join(context_pieces)
-            print(f"   Retrieved {len(docs[:n_results])} documents ({len(result)} chars)")
-            return result
+            logger.debug("   Retrieved %d documents (%d chars)", len(docs[:n_results]), len(result))
         else:
-            return "No specific information found in knowledge base."
+            result = "No specific information found in knowledge base."
+        
+        return result
     except Exception as e:
-        print(f"❌ Retriever query error: {e}")
+        logger.error("❌ Retriever query error: %s", e)
         return "Unable to retrieve context at this time."
 
 def initialize_chroma():
@@ -444,7 +464,7 @@ def crisis_wrapper(state: AgentState) -> AgentState:
 
 def information_wrapper(state: AgentState) -> AgentState:
     """Wrapper for information agent."""
-    return information_agent_node(state, llm, get_relevant_context)
+    return information_agent_node(state, information_llm, get_relevant_context)
 
 def resource_wrapper(state: AgentState) -> AgentState:
     """Wrapper for resource agent."""
@@ -455,8 +475,8 @@ def assessment_wrapper(state: AgentState) -> AgentState:
     return assessment_agent_node(state, llm, get_relevant_context)
 
 def escalation_wrapper(state: AgentState) -> AgentState:
-    """Wrapper for human escalation agent."""
-    return human_escalation_node(state, llm, get_relevant_context)
+    """Wrapper for human escalation agent (rule-based - no LLM or RAG needed)."""
+    return human_escalation_node(state)
 
 # Create the workflow
 def create_workflow():
@@ -558,6 +578,8 @@ def check_for_data_updates(force: bool = False):
         if has_changes:
             print("🔄 Performing smart update...")
             agent.perform_smart_update()
+            context_cache.clear()  # Cached retrievals may be stale now
+            llm_response_cache.clear()  # ...and so may answers built on them
             print("✅ ChromaDB updated with new data")
             return True
         else:
@@ -11,6 +11,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 from dotenv import load_dotenv
 from langchain_groq import ChatGroq
 
+from agent.cache import generate_query_seed
+
 # Load environment
 load_dotenv()
 
@@ -20,8 +22,6 @@ def test_query_seed_generation():
     print("\n🔍 Testing Query Seed Generation")
     print("=" * 70)
     
-    import hashlib
-    
     test_queries = [
         "I'm feeling anxious",
         "I'm feeling anxious",  # Exact duplicate
@@ -31,14 +31,18 @@ def test_query_seed_generation():
     ]
     
     for query in test_queries:
-        seed = int(hashlib.md5(query.lower().strip().encode()).hexdigest()[:8], 16)
+        seed = generate_query_seed(query)
         print(f"Query: '{query}'")
         print(f"  Seed: {seed}\n")
     
     # Check that identical queries (after normalization) produce same seed
-    seed1 = int(hashlib.md5("I'm feeling anxious".lower().strip().encode()).hexdigest()[:8], 16)
-    seed2 = int(hashlib.md5("I'M FEELING ANXIOUS".lower().strip().encode()).hexdigest()[:8], 16)
-    seed3 = int(hashlib.md5("  I'm feeling anxious  ".lower().strip().encode()).hexdigest()[:8], 16)
+    seed1 = generate_query_seed("I'm feeling anxious")
+    seed2 = generate_query_seed("I'M FEELING ANXIOUS")
+    seed3 = generate_query_seed("  I'm feeling anxious  ")
+    
+    if not 0 <= seed1 < 2 ** 32:
+        print("❌ Seed is not an unsigned 32-bit integer")
+        return False
     
     if seed1 == seed2 == seed3:
         print("✅ Identical queries (normalized) produce same seed")
@@ -65,8 +69,7 @@ def test_llm_consistency():
     )
     
     query = "I'm feeling anxious"
-    import hashlib
-    query_seed = int(hashlib.md5(query.lower().strip().encode()).hexdigest()[:8], 16)
+    query_seed = generate_query_seed(query)
     
     prompt = f"In 1 sentence, provide supportive advice for someone who says: '{query}'"
     
@@ -103,8 +106,6 @@ def test_different_queries_different_seeds():
     print("\n🔀 Testing Different Queries")
     print("=" * 70)
     
-    import hashlib
-    
     queries = [
         "I'm feeling anxious",
         "I'm feeling sad",
@@ -113,7 +114,7 @@ def test_different_queries_different_seeds():
     
     seeds = []
     for query in queries:
-        seed = int(hashlib.md5(query.lower().strip().encode()).hexdigest()[:8], 16)
+        seed = generate_query_seed(query)
         seeds.append(seed)
         print(f"Query: '{query}' → Seed: {seed}")
     
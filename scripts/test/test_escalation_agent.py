@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Escalation Agent Referral Rules - Validation Test
+Verifies rule-based service selection and template messages without any LLM calls.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from agent.escalation_agent import (
+    decide_referral_service,
+    human_escalation_node,
+    REFERRAL_TEMPLATES,
+)
+
+
+class NoLLM:
+    """LLM stand-in that fails the test if the agent calls it."""
+    def invoke(self, *args, **kwargs):
+        raise AssertionError("Escalation must stay rule-based (no LLM call)")
+
+
+def no_context(query, n_results=3):
+    raise AssertionError("Escalation templates should not need retrieval")
+
+
+def test_referral_rules():
+    """Test keyword buckets and rule priority in decide_referral_service."""
+    print("\n🧪 Testing Referral Rules")
+    print("=" * 60)
+
+    test_cases = [
+        # (query, distress_level, expected service, expected reason)
+        ("I need a psychiatrist", 'none', 'IMH', 'high_severity'),
+        ("I can't cope anymore", 'none', 'IMH', 'high_severity'),
+        ("I'm a Student and it's TOO MUCH", 'none', 'IMH', 'high_severity'),  # Rule 1 beats Rule 2
+        ("I'm 17 and stressed", 'none', 'CHAT', 'youth_focused'),
+        ("teenager here", 'high', 'CHAT', 'youth_focused'),  # Rule 2 beats distress level
+        ("I want to talk to someone", 'high', 'IMH', 'high_distress'),
+        ("I want to talk to someone", 'none', 'CHAT', 'accessible_default'),
+        # Substring semantics: inflected/attached forms must still match
+        ("two hospitals said no", 'none', 'IMH', 'high_severity'),
+        ("we're all students", 'none', 'CHAT', 'youth_focused'),
+        ("I'm 19yo", 'none', 'CHAT', 'youth_focused'),
+        # Short replies: shortest keywords are 2 chars, so "16" must still match
+        ("16", 'none', 'CHAT', 'youth_focused'),
+        ("ok", 'high', 'IMH', 'high_distress'),
+        ("k", 'none', 'CHAT', 'accessible_default'),
+    ]
+
+    passed = 0
+    for query, distress_level, service, reason in test_cases:
+        result = decide_referral_service(query, distress_level)
+        if result['service'] == service and result['reason'] == reason:
+            print(f"✅ '{query}' ({distress_level}) → {service}/{reason}")
+            passed += 1
+        else:
+            print(f"❌ '{query}' ({distress_level}) → {result['service']}/{result['reason']}, "
+                  f"expected {service}/{reason}")
+
+    print(f"\nResult: {passed}/{len(test_cases)} tests passed")
+    return passed == len(test_cases)
+
+
+def test_escalation_messages():
+    """Test the node picks the matching pre-crafted template without LLM/RAG calls."""
+    print("\n🧪 Testing Escalation Templates")
+    print("=" * 60)
+
+    test_cases = [
+        ("I'm in university", "", 'CHAT_youth'),
+        ("I need a psychiatrist", "", 'IMH_high_severity'),
+        ("hello", "", 'CHAT_general'),
+        ("hello", "ASSESSMENT_SUGGESTION", 'assessment_suggestion'),
+    ]
+
+    passed = 0
+    for query, context, template in test_cases:
+        state = {
+            "current_query": query,
+            "messages": [],
+            "current_agent": "human_escalation",
+            "crisis_detected": False,
+            "context": context
+        }
+        state = human_escalation_node(state, NoLLM(), no_context)
+        if state["messages"] == [REFERRAL_TEMPLATES[template]] and state["current_agent"] == "complete":
+            print(f"✅ '{query}' → {template}")
+            passed += 1
+        else:
+            print(f"❌ '{query}' → unexpected template, expected {template}")
+
+    print(f"\nResult: {passed}/{len(test_cases)} tests passed")
+    return passed == len(test_cases)
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("🤝 ESCALATION AGENT REFERRAL TESTS")
+    print("=" * 60)
+
+    results = [
+        test_referral_rules(),
+        test_escalation_messages(),
+    ]
+
+    print("\n" + "=" * 60)
+    print(f"SUMMARY: {sum(results)}/{len(results)} test groups passed")
+    print("=" * 60)
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)